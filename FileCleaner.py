@@ -3,147 +3,751 @@ import warnings
 warnings.filterwarnings('ignore')
 import os
 
-#!this line is needed for code to execute properly
-path = os.path.expanduser("")
-
-#imports for creating custom FileReader tool
-from pydantic.v1 import BaseModel
-from crewai_tools import BaseTool
+#imports for the file reading and caching helpers
+import concurrent.futures
+import hashlib
+import io
+import json
+import mmap
 import os
+import threading
+from collections import OrderedDict
 
-#needed for creating a custom tool
-class FolderInput(BaseModel):
-    folder_path: str
+__all__ = ['FileCleaner', 'FileReaderTool', 'BatchFileReaderTool', 'FileSummarizerTool', 'FolderInput']
 
-#create a custom tool to use with crewai agents
-class FileReaderTool(BaseTool):
-    #constructor
-    def __init__(self):
-        super().__init__(
-            name="file_reader",
-            description="Reads all text files from a folder and returns their contents.",
-            args_schema=FolderInput
+#resolve the home directory once so path expansion never repeats the
+#getpwuid lookup that os.path.expanduser pays on every call
+_HOME = os.path.expanduser("~")
+
+def _expand(path):
+    #expand a leading ~ using the memoized home directory
+    if path == "~" or path.startswith("~/"):
+        return _HOME + path[1:]
+    return path
+
+#cap the right-sized read buffer at 1 MiB and mmap anything over 8 MiB
+_MAX_READ_BUFFER = 1 << 20
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+#single shared thread pool for file reads, created lazily on first use
+#file i/o releases the GIL so threads overlap the blocking syscalls
+_READ_EXECUTOR = None
+
+def _get_read_executor():
+    global _READ_EXECUTOR
+    if _READ_EXECUTOR is None:
+        _READ_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
         )
+    return _READ_EXECUTOR
 
-    #tool run method
-    def _run(self, folder_path: str):
-        """read all text files in a target folder
+#on-disk cache of standard folder profiles keyed by a hash of folder state
+_PROFILE_CACHE_DIR = os.path.join(_HOME, ".cache", "filecleaner")
 
-        Args:
-            folder_path (str): path to the target folder
+def _standard_folder_hash(folder_path):
+    """hash the state of a standard folder for profile caching
 
-        Returns:
-            a dictionary of file names and their contents
-        """
-        #check that path is valid
-        if not os.path.isdir(folder_path):
-            return "Provided path is not a directory."
-        
-        #initialize file contents
-        file_contents = {}
-
-        #iterate through all text files in folder and read file by file
-        for filename in os.listdir(folder_path):
-            file_path = os.path.join(folder_path, filename)
-            if os.path.isfile(file_path):
+    Args:
+        folder_path (str): path to the standard folder
+
+    Returns:
+        a hex digest over the sorted (name, mtime_ns, size) of every file,
+        or None if the path is not a directory
+    """
+    if not os.path.isdir(folder_path):
+        return None
+    entries = []
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    digest = hashlib.blake2b(digest_size=16)
+    for name, mtime_ns, size in sorted(entries):
+        digest.update(f"{name}\x00{mtime_ns}\x00{size}\x00".encode('utf-8'))
+    return digest.hexdigest()
+
+def _load_standard_profile(folder_hash):
+    #return the cached profile for this folder state, or None on a miss
+    if folder_hash is None:
+        return None
+    cache_path = os.path.join(_PROFILE_CACHE_DIR, f"standard_{folder_hash}.json")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)["profile"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+def _save_standard_profile(folder_hash, profile):
+    #persist a computed profile so later kickoffs can skip standard_read
+    if folder_hash is None or not profile:
+        return
+    try:
+        os.makedirs(_PROFILE_CACHE_DIR, exist_ok=True)
+        cache_path = os.path.join(_PROFILE_CACHE_DIR, f"standard_{folder_hash}.json")
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({"profile": profile}, f)
+    except OSError:
+        pass
+
+#files over the threshold are split into chunks of at most this many chars
+#so no single long prefill blocks the rest of a batch
+_OVERSIZE_THRESHOLD = 16384
+_CHUNK_SIZE = 8192
+
+def _split_content(content, chunk_size=_CHUNK_SIZE):
+    """split oversize content into chunks at paragraph boundaries
+
+    Args:
+        content (str): text to split
+        chunk_size (int): upper bound on chunk length in chars
+
+    Returns:
+        a list of chunks, each at most chunk_size chars
+    """
+    chunks = []
+    remaining = content
+    while len(remaining) > chunk_size:
+        #prefer a paragraph break, then a line break, then a hard cut
+        cut = remaining.rfind('\n\n', 0, chunk_size)
+        if cut <= 0:
+            cut = remaining.rfind('\n', 0, chunk_size)
+        if cut <= 0:
+            cut = chunk_size
+        chunks.append(remaining[:cut])
+        remaining = remaining[cut:].lstrip('\n')
+    if remaining:
+        chunks.append(remaining)
+    return chunks
+
+#overall character budget for a single tool result, sized to the context
+#window so peak output is bounded by the prompt budget and not folder size
+_RESULT_CHAR_BUDGET = 200_000
+
+#size bin boundaries in chars for batching files of similar length together
+_BATCH_SIZE_BINS = (2048, 20480)
+
+def _size_bin(size):
+    #map a file size onto the index of its bin
+    for bin_id, upper in enumerate(_BATCH_SIZE_BINS):
+        if size < upper:
+            return bin_id
+    return len(_BATCH_SIZE_BINS)
+
+#process-wide cache of file contents keyed by (path, mtime_ns, size)
+#unchanged files short-circuit to the cached string instead of re-reading
+_CONTENT_CACHE = OrderedDict()
+_CONTENT_CACHE_BYTES = 0
+_CONTENT_CACHE_CAP = 256 * 1024 * 1024
+_CONTENT_CACHE_LOCK = threading.Lock()
+
+def _cache_get(key):
+    #look up a cached (content, digest) pair and mark it most recently used
+    with _CONTENT_CACHE_LOCK:
+        value = _CONTENT_CACHE.get(key)
+        if value is not None:
+            _CONTENT_CACHE.move_to_end(key)
+        return value
+
+def _cache_put(key, value):
+    #insert a (content, digest) pair and evict least recently used over the cap
+    global _CONTENT_CACHE_BYTES
+    with _CONTENT_CACHE_LOCK:
+        if key in _CONTENT_CACHE:
+            return
+        _CONTENT_CACHE[key] = value
+        _CONTENT_CACHE_BYTES += len(value[0] or '')
+        while _CONTENT_CACHE_BYTES > _CONTENT_CACHE_CAP and _CONTENT_CACHE:
+            _, evicted = _CONTENT_CACHE.popitem(last=False)
+            _CONTENT_CACHE_BYTES -= len(evicted[0] or '')
+
+#bytes expected in text files: printable ascii, common control chars, and
+#high bytes so utf-8 multibyte sequences are not mistaken for binary data
+_TEXT_BYTES = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)))
+
+def _looks_binary(head):
+    #treat a NUL byte or too many non-text bytes in the head as binary
+    if not head:
+        return False
+    if b'\x00' in head:
+        return True
+    return len(head.translate(None, _TEXT_BYTES)) > 0.3 * len(head)
+
+def _read_one(name, path, cache_key=None, size=None):
+    """read a single text file for the thread pool
+
+    Args:
+        name (str): file name to key the result by
+        path (str): full path to the file
+        cache_key (tuple): optional (path, mtime_ns, size) key to cache under
+        size (int): file size from the directory entry's stat, if known
+
+    Returns:
+        a (name, content, digest) tuple where digest identifies the raw bytes
+        for duplicate detection, content is an error message with digest None
+        on failure, and content is None for binary files that should be skipped
+    """
+    try:
+        #use the raw fd interface: open + read + close is 3 syscalls per file
+        #versus the open/fstat/read/read/close of a buffered file object
+        #O_NOATIME also skips the access-time write where the kernel allows it
+        flags = os.O_RDONLY | getattr(os, 'O_NOATIME', 0)
+        try:
+            fd = os.open(path, flags)
+        except PermissionError:
+            #O_NOATIME is refused on files the process does not own
+            fd = os.open(path, os.O_RDONLY)
+
+        try:
+            #sniff the first 512 bytes before committing to the full read so
+            #binary files never pay for reading (or mapping) the whole file
+            head = os.read(fd, 512) if size != 0 else b''
+            if _looks_binary(head):
+                #remember the verdict so later invocations skip the sniff too
+                if cache_key is not None:
+                    _cache_put(cache_key, (None, None))
+                return name, None, None
+
+            if size == 0:
+                #nothing to read, skip the read syscall entirely
+                raw = b''
+            elif size is not None and size > _MMAP_THRESHOLD:
+                #very large files: let the kernel page the content in on demand
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    raw = bytes(mm)
+            else:
+                #one more read sized to the rest of the file usually drains it;
+                #loop only on short reads or if the file grew after the scan
+                want = max((size or _MAX_READ_BUFFER) - len(head), 0)
+                raw = head + (os.read(fd, want) if want else b'')
+                while chunk := os.read(fd, _MAX_READ_BUFFER):
+                    raw += chunk
+        finally:
+            os.close(fd)
+
+        #hash the raw bytes so identical files can be collapsed to one copy
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+
+        #decode with replacement so one bad byte no longer loses the whole file
+        content = raw.decode('utf-8', errors='replace')
+
+        #on high replacement density, retry with a detected encoding
+        if content.count('�') > 0.02 * max(len(content), 1):
+            content = _decode_fallback(raw, content)
+
+        if cache_key is not None:
+            _cache_put(cache_key, (content, digest))
+        return name, content, digest
+    except Exception as ex:
+        return name, f"Error reading file: {str(ex)}", None
+
+def _decode_fallback(raw, replaced):
+    #sniff the real encoding with charset_normalizer, keeping the utf-8
+    #replacement decode if detection is unavailable or fails
+    try:
+        import charset_normalizer
+    except ImportError:
+        return replaced
+    best = charset_normalizer.from_bytes(raw).best()
+    if best is None:
+        return replaced
+    return str(best)
+
+def _summarize_files(contents, max_concurrency=16):
+    """summarize each file's content with concurrent model calls
+
+    Args:
+        contents (dict): file names mapped to their contents
+        max_concurrency (int): cap on in-flight requests
+
+    Returns:
+        a dictionary of file names mapped to summary strings, or to
+        {"error": ...} / {"same_as": ...} markers
+    """
+    import asyncio
+    from openai import AsyncOpenAI
+
+    #issue all requests concurrently so the provider's continuous batching
+    #coalesces them into shared decode batches instead of a serial queue
+    async def _run_all():
+        client = AsyncOpenAI()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(name, part, label, text):
+            #a failed request only costs its own file, never the whole folder
+            async with semaphore:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        file_contents[filename] = f.read()
+                    response = await client.chat.completions.create(
+                        model=os.environ.get("OPENAI_MODEL_NAME", "gpt-4o-mini"),
+                        messages=[
+                            {"role": "system", "content": "Summarize the following text file precisely and in detail."},
+                            {"role": "user", "content": f"File {label}:\n{text}"},
+                        ],
+                    )
+                    return name, part, response.choices[0].message.content, None
                 except Exception as ex:
-                    file_contents[filename] = f"Error reading file: {str(ex)}"
+                    return name, part, None, str(ex)
+
+        requests = []
+        for name, content in contents.items():
+            if not isinstance(content, str) or content.startswith("Error reading file:"):
+                continue
+            if len(content) > _OVERSIZE_THRESHOLD:
+                #oversize files go out as chunked requests so no single call
+                #carries an unbounded prefill or blows the context window
+                chunks = _split_content(content)
+                total = len(chunks)
+                for part, chunk in enumerate(chunks, 1):
+                    requests.append(_one(name, part, f"{name} [part {part}/{total}]", chunk))
+            else:
+                requests.append(_one(name, 1, name, content))
+        return await asyncio.gather(*requests)
+
+    results = asyncio.run(_run_all())
+
+    #reassemble chunk summaries per file and record per-file failures
+    parts = {}
+    errors = {}
+    for name, part, summary, error in results:
+        if error is not None:
+            errors.setdefault(name, error)
+        else:
+            parts.setdefault(name, {})[part] = summary
+
+    #carry duplicate markers through and surface unreadable files as errors
+    summaries = {}
+    for name, content in contents.items():
+        if isinstance(content, dict):
+            summaries[name] = content
+        elif content.startswith("Error reading file:"):
+            summaries[name] = {"error": content}
+        elif name in errors:
+            summaries[name] = {"error": f"Summarization failed: {errors[name]}"}
+        else:
+            by_part = parts.get(name, {})
+            summaries[name] = '\n'.join(by_part[part] for part in sorted(by_part))
+    return summaries
+
+def _read_folder(folder_path):
+    """read all text files in a folder
+
+    Args:
+        folder_path (str): path to the folder
+
+    Returns:
+        a dictionary of file names and their contents, with duplicates
+        replaced by {"same_as": name} markers, or an error message
+    """
+    #check that path is valid
+    if not os.path.isdir(folder_path):
+        return "Provided path is not a directory."
+
+    #initialize collected (content, digest) pairs
+    results = {}
+
+    #iterate through all text files in folder and submit each to the thread pool
+    #scandir returns entries with cached stat info, avoiding a stat syscall per file
+    executor = _get_read_executor()
+    futures = []
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                #check the content cache first so unchanged files skip the read
+                st = entry.stat(follow_symlinks=False)
+                cache_key = (entry.path, st.st_mtime_ns, st.st_size)
+                cached = _cache_get(cache_key)
+                if cached is not None:
+                    #a cached (None, None) records a binary verdict: omit it
+                    if cached[0] is not None:
+                        results[entry.name] = cached
+                else:
+                    futures.append(executor.submit(_read_one, entry.name, entry.path, cache_key, st.st_size))
 
-        #return the contents of the files
-        return file_contents
+    #collect results as the reads complete, omitting skipped binary files
+    for future in concurrent.futures.as_completed(futures):
+        name, content, digest = future.result()
+        if content is not None:
+            results[name] = (content, digest)
+
+    #collapse identical files: the first name keeps the content, later
+    #copies become {"same_as": name} references so the bytes go out once
+    file_contents = {}
+    seen = {}
+    for name in sorted(results):
+        content, digest = results[name]
+        if digest is not None and digest in seen:
+            file_contents[name] = {"same_as": seen[digest]}
+        else:
+            if digest is not None:
+                seen[digest] = name
+            file_contents[name] = content
+
+    #return the contents of the files
+    return file_contents
+
+#the tool classes subclass crewai_tools.BaseTool, whose import is heavy, so
+#they are defined lazily on first access (PEP 562) instead of at import time
+def _load_tools():
+    global FolderInput, FileReaderTool, BatchFileReaderTool, FileSummarizerTool
+    if 'FileReaderTool' in globals():
+        return
+
+    #args_schema must stay a pydantic.v1 model: the pinned crewai_tools
+    #BaseTool declares args_schema as Type[v1 BaseModel] and rejects v2 models
+    from pydantic.v1 import BaseModel
+    from crewai_tools import BaseTool
+
+    #needed for creating a custom tool
+    class FolderInput(BaseModel):
+        folder_path: str
+
+    #create a custom tool to use with crewai agents
+    class FileReaderTool(BaseTool):
+        #constructor
+        def __init__(self):
+            super().__init__(
+                name="file_reader",
+                description="Reads all text files from a folder and returns their contents "
+                            "as JSONL: one {\"name\": ..., \"content\": ...} object per line.",
+                args_schema=FolderInput
+            )
+
+        #tool run method
+        def _run(self, folder_path: str):
+            """read all text files in a target folder
+
+            Args:
+                folder_path (str): path to the target folder
+
+            Returns:
+                a JSONL string with one {"name", "content"} object per file,
+                truncated once the overall character budget is spent
+            """
+            contents = _read_folder(folder_path)
+            if isinstance(contents, str):
+                return contents
+
+            #emit pre-formatted JSONL so the framework returns the string as-is
+            #instead of walking and re-serializing a dict per tool call, and
+            #cap the result so the output is bounded by the prompt budget
+            #rather than by folder size
+            out = io.StringIO()
+            remaining = _RESULT_CHAR_BUDGET
+            names = sorted(contents)
+            for index, name in enumerate(names):
+                content = contents[name]
+                if isinstance(content, dict):
+                    #duplicate file: point at the canonical copy by name
+                    line = json.dumps({"name": name, "same_as": content["same_as"]}, ensure_ascii=False) + '\n'
+                else:
+                    line = json.dumps({"name": name, "content": content}, ensure_ascii=False) + '\n'
+                    if len(line) > remaining:
+                        #cut the content down so the line fits what is left
+                        keep = max(remaining - (len(line) - len(content)) - 20, 0)
+                        line = json.dumps({"name": name, "content": content[:keep], "truncated": True},
+                                          ensure_ascii=False) + '\n'
+                if len(line) > remaining:
+                    #budget exhausted: note how many files were left out
+                    out.write(json.dumps({"skipped_files": len(names) - index}))
+                    out.write('\n')
+                    break
+                out.write(line)
+                remaining -= len(line)
+            return out.getvalue()
+
+        def read_batched(self, folder_path: str, max_chars: int = 60000):
+            """read all text files in a folder packed into delimited batches
+
+            Args:
+                folder_path (str): path to the target folder
+                max_chars (int): character budget for each batch
+
+            Returns:
+                a list of strings, each containing one or more files delimited
+                by <<<FILE name>>> markers, or an error message
+            """
+            contents = _read_folder(folder_path)
+            if isinstance(contents, str):
+                return contents
+
+            #render each file as a delimited block, duplicates as a reference,
+            #and oversize files as labeled part chunks so no single long file
+            #produces one giant prefill that stalls the rest of a batch
+            blocks = []
+            for name in sorted(contents):
+                content = contents[name]
+                if isinstance(content, dict):
+                    blocks.append(f"<<<FILE {name}>>>\n(identical to {content['same_as']})\n")
+                elif len(content) > _OVERSIZE_THRESHOLD:
+                    chunks = _split_content(content)
+                    total = len(chunks)
+                    for part, chunk in enumerate(chunks, 1):
+                        blocks.append(f"<<<FILE {name} [part {part}/{total}]>>>\n{chunk}\n")
+                else:
+                    blocks.append(f"<<<FILE {name}>>>\n{content}\n")
+
+            #bin blocks by size so each batch holds similar-length pieces and a
+            #single huge block does not stretch a batch of small neighbors
+            bins = {bin_id: [] for bin_id in range(len(_BATCH_SIZE_BINS) + 1)}
+            for block in blocks:
+                bins[_size_bin(len(block))].append(block)
+
+            #pack files into batches up to the char budget so the model can
+            #summarize many files in a single call instead of one per file
+            batches = []
+            for bin_id in sorted(bins):
+                current = []
+                current_len = 0
+                for block in bins[bin_id]:
+                    if current and current_len + len(block) > max_chars:
+                        batches.append(''.join(current))
+                        current = []
+                        current_len = 0
+                    current.append(block)
+                    current_len += len(block)
+                if current:
+                    batches.append(''.join(current))
+            return batches
+
+    #create a batched variant of the reader so one tool call covers many files
+    class BatchFileReaderTool(BaseTool):
+        #constructor
+        def __init__(self):
+            super().__init__(
+                name="batch_file_reader",
+                description="Reads all text files from a folder and returns them packed into "
+                            "batches, each file delimited by a <<<FILE name>>> marker.",
+                args_schema=FolderInput
+            )
+
+        #tool run method
+        def _run(self, folder_path: str):
+            """read all text files in a target folder as delimited batches
+
+            Args:
+                folder_path (str): path to the target folder
+
+            Returns:
+                a list of delimited batch strings
+            """
+            return _get_reader_tool().read_batched(folder_path)
+
+    #create a tool that fans per-file summaries out as concurrent model calls
+    class FileSummarizerTool(BaseTool):
+        #constructor
+        def __init__(self):
+            super().__init__(
+                name="file_summarizer",
+                description="Reads all text files from a folder and returns a per-file summary "
+                            "as JSONL: one {\"name\": ..., \"summary\": ...} object per line.",
+                args_schema=FolderInput
+            )
+
+        #tool run method
+        def _run(self, folder_path: str):
+            """summarize all text files in a folder with concurrent model calls
+
+            Args:
+                folder_path (str): path to the target folder
+
+            Returns:
+                a JSONL string with one {"name", "summary"} object per file
+            """
+            contents = _read_folder(folder_path)
+            if isinstance(contents, str):
+                return contents
+
+            summaries = _summarize_files(contents)
+            out = io.StringIO()
+            for name in sorted(summaries):
+                summary = summaries[name]
+                if isinstance(summary, dict):
+                    #duplicate or failure marker: pass the reason through
+                    obj = {"name": name, **summary}
+                else:
+                    obj = {"name": name, "summary": summary}
+                out.write(json.dumps(obj, ensure_ascii=False))
+                out.write('\n')
+            return out.getvalue()
+
+#the shared reader lives in a module global rather than on the class because
+#pydantic models turn underscored class attributes into managed private attrs,
+#which breaks a __new__-based singleton
+_READER_TOOL = None
+
+def _get_reader_tool():
+    #hand out one FileReaderTool so every caller hits the same content cache
+    global _READER_TOOL
+    if _READER_TOOL is None:
+        _load_tools()
+        _READER_TOOL = FileReaderTool()
+    return _READER_TOOL
+
+def __getattr__(name):
+    #resolve the tool classes lazily so plain module imports stay fast
+    if name in ('FolderInput', 'FileReaderTool', 'BatchFileReaderTool', 'FileSummarizerTool'):
+        _load_tools()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 #program
 class FileCleaner:
+    #agents, tasks, and crews are built once and shared by every instance
+    #so repeated instantiations skip prompt compilation and validator setup
+    _built = False
+    _build_lock = threading.Lock()
+
     def __init__(self):
         #get openai api key from environmental vars and set model
         #gpt-4o-mini was used to balance cost and performance
         self.openai_api_key = os.environ.get("OPENAI_API_KEY")
         os.environ["OPENAI_MODEL_NAME"] = "gpt-4o-mini"
 
-        #crewai essential imports
-        from crewai import Agent, Task, Crew
-
-        #create an agent to read files from the target folder
-        self.file_reader = Agent(
-            role = "Computer File Reader",
-            goal = "Read through every text file within {target_folder} and generate a detailed summary of the contents of each text file.",
-            backstory = "You are an ace at reading through large text files and generating precise, detailed summaries of them."
-                        "You work at a very large firm and have decades of experience doing this.",
-            verbose = True,
-            tools = [FileReaderTool()]
-        )
+        #build the shared crews on first instantiation only
+        type(self)._build_crews()
 
-        #create an agent to read files from a standard folder
-        self.standard_analyzer = Agent(
-            role = "File Standard Analyzer",
-            goal = "Read through all text files within {standard_folder} and generate a detailed list of criteria that an ideal folder has."
-                   "The ideal folder contains only good text files. The contents of the file text files are to be analyzed to attribute them "
-                   "based on criteria like date, content type, etc.",
-            verbose = True,
-            tools = [FileReaderTool()],
-            backstory = "You are an expert at reading and understanding files and giving them tags based on their attributes as you have been "
-                        "in this position for forty years. You look out for things like the dates of files, whether they contain temporary or "
-                        "long-term relavent information, etc. to develop a profile of how a company likes to keep their files.",
-        )
+    @classmethod
+    def _build_crews(cls):
+        #lazily construct the agents, tasks, and crews exactly once
+        with cls._build_lock:
+            if cls._built:
+                return
 
-        #create an agent to recommend files for removal
-        self.cleanup_recommender = Agent(
-            role = "File Cleanup Recommender",
-            goal = "Create a list of file names that can be deleted as they do not contain important information. This list must include rationale.",
-            verbose = True,
-            tools = [FileReaderTool()],
-            backstory = "You have a keen and experienced eye to compare the ideal profile of what a company wants their folders to be like with "
-                        "a folder selected for cleanup. Through your exceptional analysis, you are able to select which files in {target_folder} "
-                        "a company should delete. You don't delete essential information, but you are also not conservative, and have unmatched judgement.",
-        )
+            #crewai essential imports
+            from crewai import Agent, Task, Crew
 
-        #create a task to summarize files in target folder
-        self.target_read = Task(
-            description = """
-            Read through all text files in {target_folder} and summarize every file in there.
-            """,
-            expected_output = """
-            A detailed summary of the contexts of every file.
-            """,
-            agent = self.file_reader,
-        )
+            #make sure the lazily defined tool classes exist
+            _load_tools()
 
-        #create a task to develop a profile for what the company thinks an ideal folder is
-        self.standard_read = Task(
-            description = "Read through all text files in {standard_folder} to develop a profile for what a good folder looks like.",
-            expected_output = "A detailed break down of what a good folder of text files contains."
-                              "This should include specific attributes of a good text file that can be used for comparison.",
-            agent = self.standard_analyzer, 
-        )
+            #construct each tool once and hand the same objects to every agent
+            #so any per-instance state is shared instead of duplicated
+            cls._reader = _get_reader_tool()
+            cls._batch_reader = BatchFileReaderTool()
+            cls._summarizer = FileSummarizerTool()
 
-        #create a task to use the summaries and profile to select files for removal
-        self.recommend = Task(
-            description = "Using the created profile of what a good folder looks like and the summary of what each file contains, "
-                          "create a list of files that should be removed. Provide a few sentences of rationale for each file.",
-            expected_output = "A list of files that should be removed with a few sentences of rationale for each file."
-                              "These files are also categorized based on whether they are useless, may be needed for specific uses, "
-                              "and/or need further human review.",
-            agent = self.cleanup_recommender,
-        )
+            #create an agent to read files from the target folder
+            cls.file_reader = Agent(
+                role = "Computer File Reader",
+                goal = "Read through every text file within {target_folder} and generate a detailed summary of the contents of each text file.",
+                backstory = "You are an ace at reading through large text files and generating precise, detailed summaries of them."
+                            "You work at a very large firm and have decades of experience doing this.",
+                verbose = True,
+                #each task has a dedicated agent; delegation off also keeps the
+                #shared tasks from accreting delegation tools on every kickoff
+                allow_delegation = False,
+                tools = [cls._batch_reader, cls._summarizer]
+            )
+
+            #create an agent to read files from a standard folder
+            cls.standard_analyzer = Agent(
+                role = "File Standard Analyzer",
+                goal = "Read through all text files within {standard_folder} and generate a detailed list of criteria that an ideal folder has."
+                       "The ideal folder contains only good text files. The contents of the file text files are to be analyzed to attribute them "
+                       "based on criteria like date, content type, etc.",
+                verbose = True,
+                allow_delegation = False,
+                tools = [cls._reader],
+                backstory = "You are an expert at reading and understanding files and giving them tags based on their attributes as you have been "
+                            "in this position for forty years. You look out for things like the dates of files, whether they contain temporary or "
+                            "long-term relavent information, etc. to develop a profile of how a company likes to keep their files.",
+            )
+
+            #create an agent to recommend files for removal
+            cls.cleanup_recommender = Agent(
+                role = "File Cleanup Recommender",
+                goal = "Create a list of file names that can be deleted as they do not contain important information. This list must include rationale.",
+                verbose = True,
+                allow_delegation = False,
+                tools = [cls._reader],
+                backstory = "You have a keen and experienced eye to compare the ideal profile of what a company wants their folders to be like with "
+                            "a folder selected for cleanup. Through your exceptional analysis, you are able to select which files in {target_folder} "
+                            "a company should delete. You don't delete essential information, but you are also not conservative, and have unmatched judgement.",
+            )
+
+            #create a task to summarize files in target folder
+            cls.target_read = Task(
+                description = """
+                Summarize all text files in {target_folder}. Prefer the file_summarizer tool,
+                which returns one JSONL summary per file computed in parallel; synthesize its
+                output into the final report. If you need raw contents instead, use the
+                batch_file_reader tool, whose batches delimit files with <<<FILE name>>> markers.
+                Large files appear as <<<FILE name [part k/m]>>> chunks: summarize each chunk,
+                then combine the chunk summaries into one summary per file.
+                """,
+                expected_output = """
+                A detailed summary of the contexts of every file.
+                """,
+                agent = cls.file_reader,
+                #independent of the standard folder, so run it concurrently
+                async_execution = True,
+            )
+
+            #create a task to develop a profile for what the company thinks an ideal folder is
+            cls.standard_read = Task(
+                description = "Read through all text files in {standard_folder} to develop a profile for what a good folder looks like."
+                              "The file_reader tool returns JSONL with one {{\"name\", \"content\"}} object per file.",
+                expected_output = "A detailed break down of what a good folder of text files contains."
+                                  "This should include specific attributes of a good text file that can be used for comparison.",
+                agent = cls.standard_analyzer,
+                #independent of the target folder, so run it concurrently
+                async_execution = True,
+            )
+
+            #create a task to use the summaries and profile to select files for removal
+            cls.recommend = Task(
+                description = "Using the created profile of what a good folder looks like and the summary of what each file contains, "
+                              "create a list of files that should be removed. Provide a few sentences of rationale for each file.",
+                expected_output = "A list of files that should be removed with a few sentences of rationale for each file."
+                                  "These files are also categorized based on whether they are useless, may be needed for specific uses, "
+                                  "and/or need further human review.",
+                agent = cls.cleanup_recommender,
+                #fan in: wait on both concurrent tasks and use their outputs
+                context = [cls.target_read, cls.standard_read],
+            )
+
+            #create a recommend variant that takes a cached profile instead of standard_read output
+            cls.recommend_cached = Task(
+                description = "Using the following profile of what a good folder looks like and the summary of what each file contains, "
+                              "create a list of files that should be removed. Provide a few sentences of rationale for each file.\n"
+                              "Profile of a good folder:\n{standard_profile}",
+                expected_output = "A list of files that should be removed with a few sentences of rationale for each file."
+                                  "These files are also categorized based on whether they are useless, may be needed for specific uses, "
+                                  "and/or need further human review.",
+                agent = cls.cleanup_recommender,
+                context = [cls.target_read],
+            )
+
+            #initialize crew
+            cls.file_cleaner_crew = Crew(
+                agents = [
+                    cls.file_reader,
+                    cls.standard_analyzer,
+                    cls.cleanup_recommender,
+                ],
+                tasks = [
+                    cls.target_read,
+                    cls.standard_read,
+                    cls.recommend,
+                ],
+                verbose = True,
+            )
+
+            #initialize a smaller crew that skips standard_read when the profile is cached
+            cls.cached_profile_crew = Crew(
+                agents = [
+                    cls.file_reader,
+                    cls.cleanup_recommender,
+                ],
+                tasks = [
+                    cls.target_read,
+                    cls.recommend_cached,
+                ],
+                verbose = True,
+            )
+
+            #mark construction done so later instantiations return immediately
+            cls._built = True
 
-        #initialize crew
-        self.file_cleaner_crew = Crew(
-            agents = [
-                self.file_reader,
-                self.standard_analyzer,
-                self.cleanup_recommender,
-            ],
-            tasks = [
-                self.target_read,
-                self.standard_read,
-                self.recommend,
-            ],
-            verbose = True,
-        )
-    
     def kickoff(self, target_path, standard_path):
         """create a list of text files that can be deleted from a target folder
 
@@ -156,12 +760,24 @@ class FileCleaner:
         """
         #create inputs to pass from parameters
         self.inputs = {
-            'target_folder' : os.path.expanduser(target_path),
-            'standard_folder' : os.path.expanduser(standard_path)
+            'target_folder' : _expand(target_path),
+            'standard_folder' : _expand(standard_path)
         }
 
-        #return result from kicking off crew
-        return self.file_cleaner_crew.kickoff(inputs = self.inputs)
+        #check for a cached profile of this exact standard folder state
+        folder_hash = _standard_folder_hash(self.inputs['standard_folder'])
+        profile = _load_standard_profile(folder_hash)
+        if profile is not None:
+            #cached hit: skip standard_read entirely and feed the profile in directly
+            self.inputs['standard_profile'] = profile
+            return self.cached_profile_crew.kickoff(inputs = self.inputs)
+
+        #cache miss: run the full crew, then save the computed profile for next time
+        result = self.file_cleaner_crew.kickoff(inputs = self.inputs)
+        output = self.standard_read.output
+        if output is not None:
+            _save_standard_profile(folder_hash, getattr(output, 'raw_output', None) or str(output))
+        return result
     
 if __name__ == '__main__':
     #create a new cleaner and execute code based on the specified paths